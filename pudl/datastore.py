@@ -512,8 +512,10 @@ def update(source, year, states, clobber=False, unzip=True, verbose=True,
     unless clobber is True -- in which case remove the existing data and
     replace it with a freshly downloaded copy.
 
-    Note that update_datastore.py runs this function in parallel, so files
-    multiple sources and years may be in progress simultaneously.
+    This is just check_if_need_update(), download() and organize() run in
+    sequence. update_datastore.py runs those steps itself, in parallel, so
+    that files for multiple sources and years may be in progress
+    simultaneously, and unzipping overlaps with downloading.
     Args:
         source (str): the data source to retrieve. Must be one of: 'eia860',
             'eia923', 'ferc1', or 'epacems'.
@@ -4,10 +4,20 @@ Retrieve data from EPA CEMS hourly zipped CSVs.
 This modules pulls data from EPA's published CSV files.
 """
 import os
+import zipfile
 import pandas as pd
+import pyarrow
+import pyarrow.csv
 from pudl.settings import SETTINGS
 import pudl.constants as pc
 
+# Arrow equivalents of the python types in pc.epacems_csv_dtypes
+_ARROW_TYPES = {
+    str: pyarrow.string(),
+    int: pyarrow.int64(),
+    float: pyarrow.float64(),
+}
+
 
 def get_epacems_dir(year):
     """
@@ -49,22 +59,67 @@ def get_epacems_file(year, month, state):
 def read_cems_csv(filename):
     """Read one CEMS CSV file
     Note that some columns are not read. See epacems_columns_to_ignores.
+
+    The CSV is parsed with Apache Arrow's multithreaded CSV reader, which is
+    much faster than pandas' for files this size, and only converted to a
+    pandas DataFrame once the unwanted columns have been dropped.
     """
-    df = pd.read_csv(
-        filename,
-        index_col=False,
-        usecols=lambda col: col not in pc.epacems_columns_to_ignore,
-        dtype=pc.epacems_csv_dtypes,
-    ).rename(columns=pc.epacems_rename_dict)
+    column_types = {col: _ARROW_TYPES[dtype]
+                    for col, dtype in pc.epacems_csv_dtypes.items()}
+    # Each of the EPA CEMS zipfiles contains a single CSV.
+    with zipfile.ZipFile(filename) as archive:
+        with archive.open(archive.namelist()[0]) as csv_file:
+            table = pyarrow.csv.read_csv(
+                csv_file,
+                convert_options=pyarrow.csv.ConvertOptions(
+                    column_types=column_types,
+                    # Match pandas, which reads empty strings as missing
+                    strings_can_be_null=True))
+    table = table.drop([col for col in table.column_names
+                        if col in pc.epacems_columns_to_ignore])
+    df = table.to_pandas().rename(columns=pc.epacems_rename_dict)
     return df
 
 
-def extract(epacems_years, states, verbose=True):
+def _month_in_date_range(year, month, start_date=None, end_date=None):
+    """
+    Check whether any part of a given month falls within a date range.
+
+    Args:
+        year (int): The year of the month to check.
+        month (int): The month to check.
+        start_date & end_date: date-like objects, including strings of the
+            form 'YYYY-MM-DD'. Dates are inclusive. If None, the range is
+            unbounded on that side.
+    Returns:
+        bool: True if the month overlaps with the date range.
+    """
+    month_start = pd.Timestamp(year=year, month=month, day=1)
+    if start_date is not None:
+        if month_start + pd.offsets.MonthBegin(1) <= pd.to_datetime(start_date):
+            return False
+    if end_date is not None:
+        if month_start > pd.to_datetime(end_date):
+            return False
+    return True
+
+
+def extract(epacems_years, states, verbose=True,
+            start_date=None, end_date=None):
     """
     Extract the EPA CEMS hourly data.
 
     This function is the main function of this file. It returns a generator
     for extracted DataFrames.
+
+    Args:
+        epacems_years (iterable): The years of CEMS data to extract.
+        states (iterable): The states of CEMS data to extract.
+        verbose (bool): Whether to print progress messages.
+        start_date & end_date: date-like objects, including strings of the
+            form 'YYYY-MM-DD'. If given, the monthly files which fall entirely
+            outside of this (inclusive) range are skipped, without being read.
+            Records within partially covered months are not filtered.
     """
     # TODO: this is really slow. Can we do some parallel processing?
     if verbose:
@@ -72,12 +127,17 @@ def extract(epacems_years, states, verbose=True):
     for year in epacems_years:
         if verbose:
             print(f"    {year}:", flush=True)
+        # Figure out which months are wanted once, rather than once per state
+        months = [month for month in range(1, 13)
+                  if _month_in_date_range(year, month, start_date, end_date)]
+        if not months:
+            continue
         # The keys of the us_states dictionary are the state abbrevs
         for state in states:
             if verbose:
                 print(f"        {state}:", end=" ", flush=True)
             dfs = []
-            for month in range(1, 13):
+            for month in months:
                 filename = get_epacems_file(year, month, state)
 
                 if verbose:
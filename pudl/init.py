@@ -58,6 +58,8 @@ def drop_tables(engine):
     try:
         _drop_views(engine)
         pudl.models.entities.PUDLBase.metadata.drop_all(engine)
+        # Any plant UTC offsets cached from this DB are about to be stale.
+        pudl.transform.epacems.clear_plant_utc_offset_cache()
     except sa.exc.DBAPIError as e:
         print("""Error dropping and the existing tables. This sometimes
         happens when the database organization has changed. The easiest fix
@@ -544,9 +546,14 @@ def _ETL_eia(pudl_engine, eia923_tables, eia923_years, eia860_tables,
                                  verbose=verbose,
                                  csvdir=csvdir,
                                  keep_csv=keep_csv)
+    # plants_entity_eia has just been reloaded, so any plant UTC offsets
+    # cached from it are stale.
+    pudl.transform.epacems.clear_plant_utc_offset_cache()
 
 
-def _ETL_cems(pudl_engine, epacems_years, verbose, csvdir, keep_csv, states):
+def _ETL_cems(pudl_engine, epacems_years, verbose, csvdir, keep_csv, states,
+              max_workers=2, max_in_flight=None,
+              start_date=None, end_date=None):
     """"""
     # If we're not doing CEMS, just stop here to avoid printing messages like
     # "Reading EPA CEMS data...", which could be confusing.
@@ -561,10 +568,12 @@ def _ETL_cems(pudl_engine, epacems_years, verbose, csvdir, keep_csv, states):
 
     # NOTE: This a generator for raw dataframes
     epacems_raw_dfs = pudl.extract.epacems.extract(
-        epacems_years=epacems_years, states=states, verbose=verbose)
+        epacems_years=epacems_years, states=states, verbose=verbose,
+        start_date=start_date, end_date=end_date)
     # NOTE: This is a generator for transformed dataframes
     epacems_transformed_dfs = pudl.transform.epacems.transform(
-        pudl_engine=pudl_engine, epacems_raw_dfs=epacems_raw_dfs, verbose=verbose
+        pudl_engine=pudl_engine, epacems_raw_dfs=epacems_raw_dfs,
+        verbose=verbose, max_workers=max_workers, max_in_flight=max_in_flight
     )
     if verbose:
         print("Loading tables from EPA CEMS into PUDL:")
@@ -575,12 +584,8 @@ def _ETL_cems(pudl_engine, epacems_years, verbose, csvdir, keep_csv, states):
             csvdir=csvdir,
             keep_csv=keep_csv) as loader:
 
-        for transformed_df_dict in epacems_transformed_dfs:
-            # There's currently only one dataframe in this dict at a time,
-            # but that could be changed if useful.
-            # The keys to the dict are a tuple (year, month, state)
-            for transformed_df in transformed_df_dict.values():
-                loader.add(transformed_df)
+        for _yr_st, transformed_df in epacems_transformed_dfs:
+            loader.add(transformed_df)
     if verbose:
         time_message = "    Loading    EPA CEMS took {}".format(
             time.strftime("%H:%M:%S",
@@ -604,6 +609,10 @@ def init_db(ferc1_tables=None,
             eia860_years=None,
             epacems_years=None,
             epacems_states=None,
+            epacems_max_workers=2,
+            epacems_max_in_flight=None,
+            epacems_start_date=None,
+            epacems_end_date=None,
             verbose=None,
             debug=None,
             pudl_testing=None,
@@ -633,6 +642,15 @@ def init_db(ferc1_tables=None,
             data. Note that there's only one EPA CEMS table.
         epacems_states (iterable): The list of states for which we are to pull
             EPA CEMS data. With all states, ETL takes ~8 hours.
+        epacems_max_workers (int): How many processes to use for the EPA CEMS
+            transform.
+        epacems_max_in_flight (int): The most raw EPA CEMS year-state
+            dataframes to hold in memory for the transform at once. Defaults
+            to epacems_max_workers.
+        epacems_start_date & epacems_end_date: date-like objects, including
+            strings of the form 'YYYY-MM-DD'. If given, the monthly EPA CEMS
+            files which fall entirely outside of this (inclusive) range are
+            not loaded. If None, the range is unbounded on that side.
         debug (bool): You can tell init_db to ingest whatever list of tables
             you want, but if your desired table is not in the list of known to
             be working tables, you need to set debug=True (otherwise init_db
@@ -715,6 +733,10 @@ def init_db(ferc1_tables=None,
               states=epacems_states,
               verbose=verbose,
               csvdir=csvdir,
-              keep_csv=keep_csv)
+              keep_csv=keep_csv,
+              max_workers=epacems_max_workers,
+              max_in_flight=epacems_max_in_flight,
+              start_date=epacems_start_date,
+              end_date=epacems_end_date)
 
     pudl_engine.execute("ANALYZE")
@@ -25,6 +25,9 @@ carte.
 """
 
 # Useful high-level external modules.
+import collections
+import functools
+import inspect
 import pandas as pd
 
 import pudl
@@ -33,16 +36,52 @@ import pudl.constants as pc
 # Shorthand for easier table referecnes:
 pt = pudl.models.entities.PUDLBase.metadata.tables
 
+# Default date range for PudlTabl outputs: all the working EIA 923 years.
+_DEFAULT_START_DATE = pd.Timestamp(
+    '{}-01-01'.format(min(pc.working_years['eia923'])))
+_DEFAULT_END_DATE = pd.Timestamp(
+    '{}-12-31'.format(max(pc.working_years['eia923'])))
+
 ###############################################################################
 #   Output Class, that can pull all the below tables with similar parameters
 ###############################################################################
 
 
+def _cached_df(key):
+    """Cache the dataframe returned by a PudlTabl method in its _dfs library.
+
+    The decorated method gains an update argument, ahead of its own arguments
+    so that positional calls like mcoe(False, 6.0) still work. The first time
+    it's called, or any time it's called with update=True, the dataframe is
+    generated and stored under key. Otherwise the cached dataframe is returned.
+
+    Args:
+        key (str): The name under which the output dataframe is cached.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, update=False, *args, **kwargs):
+            df = None if update else self._get_cached_df(key)
+            if df is None:
+                df = method(self, *args, **kwargs)
+                self._cache_df(key, df)
+            return df
+        # functools.wraps makes help() show the wrapped method's signature, so
+        # add update to it, where the wrapper takes it.
+        sig = inspect.signature(method)
+        params = list(sig.parameters.values())
+        params.insert(1, inspect.Parameter(
+            'update', inspect.Parameter.POSITIONAL_OR_KEYWORD, default=False))
+        wrapper.__signature__ = sig.replace(parameters=params)
+        return wrapper
+    return decorator
+
+
 class PudlTabl(object):
     """A class for compiling common useful tabular outputs from the PUDL DB."""
 
     def __init__(self, freq=None, testing=False,
-                 start_date=None, end_date=None):
+                 start_date=None, end_date=None, max_cache_mb=None):
         """Initialize the PUDL output object.
 
         Private data members are not initialized until they are requested.
@@ -59,211 +98,194 @@ class PudlTabl(object):
         testing : Whether to use the live or testing PUDL DB.
         start_date : Beginning date for data to pull from the PUDL DB.
         end_date : End date for data to pull from the PUDL DB.
+        max_cache_mb : Approximate upper limit on the memory used by cached
+               dataframes, in MB. When it's exceeded, the least recently
+               used dataframes are dropped, and will be regenerated if they
+               are requested again. If None (the default), keep everything.
 
         """
         self.freq = freq
         self.testing = testing
 
         if start_date is None:
-            self.start_date = \
-                pd.to_datetime(
-                    '{}-01-01'.format(min(pc.working_years['eia923'])))
+            self.start_date = _DEFAULT_START_DATE
         else:
             # Make sure it's a date... and not a string.
             self.start_date = pd.to_datetime(start_date)
 
         if end_date is None:
-            self.end_date = \
-                pd.to_datetime(
-                    '{}-12-31'.format(max(pc.working_years['eia923'])))
+            self.end_date = _DEFAULT_END_DATE
         else:
             # Make sure it's a date... and not a string.
             self.end_date = pd.to_datetime(end_date)
 
         # We populate this library of dataframes as they are generated, and
-        # allow them to persist, in case they need to be used again.
-        self._dfs = {
-            'pu_eia': None,
-            'pu_ferc1': None,
-
-            'utils_eia860': None,
-            'bga_eia860': None,
-            'plants_eia860': None,
-            'gens_eia860': None,
-            'own_eia860': None,
-
-            'gf_eia923': None,
-            'frc_eia923': None,
-            'bf_eia923': None,
-            'gen_eia923': None,
-
-            'plants_steam_ferc1': None,
-            'fuel_ferc1': None,
-
-            'bga': None,
-            'hr_by_unit': None,
-            'hr_by_gen': None,
-            'fuel_cost': None,
-            'capacity_factor': None,
-            'mcoe': None,
-        }
-
-    def pu_eia860(self, update=False):
+        # allow them to persist, in case they need to be used again. It's
+        # kept in least to most recently used order, so that if we run over
+        # max_cache_mb we know which dataframes to drop first.
+        self.max_cache_mb = max_cache_mb
+        self._dfs = collections.OrderedDict()
+        self._df_sizes = {}
+
+    def _get_cached_df(self, key):
+        """Look up a cached dataframe, marking it as recently used."""
+        df = self._dfs.get(key)
+        if df is not None:
+            self._dfs.move_to_end(key)
+        return df
+
+    def _cache_df(self, key, df):
+        """Cache a dataframe, evicting old ones if we're over budget."""
+        self._dfs[key] = df
+        self._dfs.move_to_end(key)
+        if self.max_cache_mb is None:
+            return
+        self._df_sizes[key] = df.memory_usage(deep=True).sum()
+        # Never evict the dataframe we just added, even if it alone is over
+        # budget -- the caller is about to use it.
+        while (len(self._dfs) > 1 and
+               sum(self._df_sizes.values()) > self.max_cache_mb * 1024**2):
+            self.invalidate(next(iter(self._dfs)))
+
+    def invalidate(self, key):
+        """Drop a cached dataframe, so it is regenerated on next request."""
+        self._dfs.pop(key, None)
+        self._df_sizes.pop(key, None)
+
+    def clear_cache(self):
+        """Drop all of the cached dataframes, e.g. to free up memory."""
+        self._dfs.clear()
+        self._df_sizes.clear()
+
+    @_cached_df('pu_eia')
+    def pu_eia860(self):
         """Pull a dataframe of EIA plant-utility associations."""
-        if update or self._dfs['pu_eia'] is None:
-            self._dfs['pu_eia'] = pudl.output.eia860.plants_utils_eia860(
-                start_date=self.start_date,
-                end_date=self.end_date,
-                testing=self.testing)
-        return self._dfs['pu_eia']
-
-    def pu_ferc1(self, update=False):
+        return pudl.output.eia860.plants_utils_eia860(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('pu_ferc1')
+    def pu_ferc1(self):
         """Pull a dataframe of FERC plant-utility associations."""
-        if update or self._dfs['pu_ferc1'] is None:
-            self._dfs['pu_ferc1'] = pudl.output.ferc1.plants_utils_ferc1(
-                testing=self.testing)
-        return self._dfs['pu_ferc1']
+        return pudl.output.ferc1.plants_utils_ferc1(testing=self.testing)
 
-    def utils_eia860(self, update=False):
+    @_cached_df('utils_eia860')
+    def utils_eia860(self):
         """Pull a dataframe describing utilities reported in EIA 860."""
-        if update or self._dfs['utils_eia860'] is None:
-            self._dfs['utils_eia860'] = pudl.output.eia860.utilities_eia860(
-                start_date=self.start_date,
-                end_date=self.end_date,
-                testing=self.testing)
-        return self._dfs['utils_eia860']
-
-    def bga_eia860(self, update=False):
+        return pudl.output.eia860.utilities_eia860(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('bga_eia860')
+    def bga_eia860(self):
         """Pull a dataframe of boiler-generator associations from EIA 860."""
-        if update or self._dfs['bga_eia860'] is None:
-            self._dfs['bga_eia860'] = \
-                pudl.output.eia860.boiler_generator_assn_eia860(
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    testing=self.testing)
-        return self._dfs['bga_eia860']
-
-    def plants_eia860(self, update=False):
+        return pudl.output.eia860.boiler_generator_assn_eia860(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('plants_eia860')
+    def plants_eia860(self):
         """Pull a dataframe of plant level info reported in EIA 860."""
-        if update or self._dfs['plants_eia860'] is None:
-            self._dfs['plants_eia860'] = pudl.output.eia860.plants_eia860(
-                start_date=self.start_date,
-                end_date=self.end_date,
-                testing=self.testing)
-        return self._dfs['plants_eia860']
-
-    def gens_eia860(self, update=False):
+        return pudl.output.eia860.plants_eia860(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('gens_eia860')
+    def gens_eia860(self):
         """Pull a dataframe describing generators, as reported in EIA 860."""
-        if update or self._dfs['gens_eia860'] is None:
-            self._dfs['gens_eia860'] = pudl.output.eia860.generators_eia860(
-                start_date=self.start_date,
-                end_date=self.end_date,
-                testing=self.testing)
-        return self._dfs['gens_eia860']
-
-    def own_eia860(self, update=False):
+        return pudl.output.eia860.generators_eia860(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('own_eia860')
+    def own_eia860(self):
         """Pull a dataframe of generator level ownership data from EIA 860."""
-        if update or self._dfs['own_eia860'] is None:
-            self._dfs['own_eia860'] = pudl.output.eia860.ownership_eia860(
-                start_date=self.start_date,
-                end_date=self.end_date,
-                testing=self.testing)
-        return self._dfs['own_eia860']
-
-    def gf_eia923(self, update=False):
+        return pudl.output.eia860.ownership_eia860(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('gf_eia923')
+    def gf_eia923(self):
         """Pull EIA 923 generation and fuel consumption data."""
-        if update or self._dfs['gf_eia923'] is None:
-            self._dfs['gf_eia923'] = \
-                pudl.output.eia923.generation_fuel_eia923(
-                    freq=self.freq,
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    testing=self.testing)
-        return self._dfs['gf_eia923']
-
-    def frc_eia923(self, update=False):
+        return pudl.output.eia923.generation_fuel_eia923(
+            freq=self.freq,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('frc_eia923')
+    def frc_eia923(self):
         """Pull EIA 923 fuel receipts and costs data."""
-        if update or self._dfs['frc_eia923'] is None:
-            self._dfs['frc_eia923'] = \
-                pudl.output.eia923.fuel_receipts_costs_eia923(
-                    freq=self.freq,
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    testing=self.testing)
-        return self._dfs['frc_eia923']
-
-    def bf_eia923(self, update=False):
+        return pudl.output.eia923.fuel_receipts_costs_eia923(
+            freq=self.freq,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('bf_eia923')
+    def bf_eia923(self):
         """Pull EIA 923 boiler fuel consumption data."""
-        if update or self._dfs['bf_eia923'] is None:
-            self._dfs['bf_eia923'] = pudl.output.eia923.boiler_fuel_eia923(
-                freq=self.freq,
-                start_date=self.start_date,
-                end_date=self.end_date,
-                testing=self.testing)
-        return self._dfs['bf_eia923']
-
-    def gen_eia923(self, update=False):
+        return pudl.output.eia923.boiler_fuel_eia923(
+            freq=self.freq,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('gen_eia923')
+    def gen_eia923(self):
         """Pull EIA 923 net generation data by generator."""
-        if update or self._dfs['gen_eia923'] is None:
-            self._dfs['gen_eia923'] = pudl.output.eia923.generation_eia923(
-                freq=self.freq,
-                start_date=self.start_date,
-                end_date=self.end_date,
-                testing=self.testing)
-        return self._dfs['gen_eia923']
-
-    def plants_steam_ferc1(self, update=False):
+        return pudl.output.eia923.generation_eia923(
+            freq=self.freq,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('plants_steam_ferc1')
+    def plants_steam_ferc1(self):
         """Pull the FERC Form 1 steam plants data."""
-        if update or self._dfs['plants_steam_ferc1'] is None:
-            self._dfs['plants_steam_ferc1'] = \
-                pudl.output.ferc1.plants_steam_ferc1(testing=self.testing)
-        return self._dfs['plants_steam_ferc1']
+        return pudl.output.ferc1.plants_steam_ferc1(testing=self.testing)
 
-    def fuel_ferc1(self, update=False):
+    @_cached_df('fuel_ferc1')
+    def fuel_ferc1(self):
         """Pull the FERC Form 1 steam plants fuel consumption data."""
-        if update or self._dfs['fuel_ferc1'] is None:
-            self._dfs['fuel_ferc1'] = pudl.output.ferc1.fuel_ferc1(
-                testing=self.testing)
-        return self._dfs['fuel_ferc1']
+        return pudl.output.ferc1.fuel_ferc1(testing=self.testing)
 
-    def bga(self, update=False):
+    @_cached_df('bga')
+    def bga(self):
         """Pull the more complete EIA/PUDL boiler-generator associations."""
-        if update or self._dfs['bga'] is None:
-            self._dfs['bga'] = pudl.output.glue.boiler_generator_assn(
-                start_date=self.start_date,
-                end_date=self.end_date,
-                testing=self.testing)
-        return self._dfs['bga']
-
-    def heat_rate_by_gen(self, update=False, verbose=False):
+        return pudl.output.glue.boiler_generator_assn(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            testing=self.testing)
+
+    @_cached_df('hr_by_gen')
+    def heat_rate_by_gen(self, verbose=False):
         """Calculate and return generator level heat rates (mmBTU/MWh)."""
-        if update or self._dfs['hr_by_gen'] is None:
-            self._dfs['hr_by_gen'] = pudl.analysis.mcoe.heat_rate_by_gen(
-                self, verbose=verbose)
-        return self._dfs['hr_by_gen']
+        return pudl.analysis.mcoe.heat_rate_by_gen(self, verbose=verbose)
 
-    def heat_rate_by_unit(self, update=False, verbose=False):
+    @_cached_df('hr_by_unit')
+    def heat_rate_by_unit(self, verbose=False):
         """Calculate and return generation unit level heat rates."""
-        if update or self._dfs['hr_by_unit'] is None:
-            self._dfs['hr_by_unit'] = pudl.analysis.mcoe.heat_rate_by_unit(
-                self, verbose=verbose)
-        return self._dfs['hr_by_unit']
+        return pudl.analysis.mcoe.heat_rate_by_unit(self, verbose=verbose)
 
-    def fuel_cost(self, update=False, verbose=False):
+    @_cached_df('fuel_cost')
+    def fuel_cost(self, verbose=False):
         """Calculate and return generator level fuel costs per MWh."""
-        if update or self._dfs['fuel_cost'] is None:
-            self._dfs['fuel_cost'] = pudl.analysis.mcoe.fuel_cost(
-                self, verbose=verbose)
-        return self._dfs['fuel_cost']
+        return pudl.analysis.mcoe.fuel_cost(self, verbose=verbose)
 
-    def capacity_factor(self, update=False, verbose=False):
+    @_cached_df('capacity_factor')
+    def capacity_factor(self, verbose=False):
         """Calculate and return generator level capacity factors."""
-        if update or self._dfs['capacity_factor'] is None:
-            self._dfs['capacity_factor'] = pudl.analysis.mcoe.capacity_factor(
-                self, verbose=verbose)
-        return self._dfs['capacity_factor']
+        return pudl.analysis.mcoe.capacity_factor(self, verbose=verbose)
 
-    def mcoe(self, update=False,
+    @_cached_df('mcoe')
+    def mcoe(self,
              min_heat_rate=5.5, min_fuel_cost_per_mwh=0.0,
              min_cap_fact=0.0, max_cap_fact=1.5, verbose=False):
         """Calculate and return generator level MCOE based on EIA data.
@@ -273,12 +295,10 @@ class PudlTabl(object):
         to EIA are included. They are attibuted based on the unit-level heat
         rates and fuel costs.
         """
-        if update or self._dfs['mcoe'] is None:
-            self._dfs['mcoe'] = pudl.analysis.mcoe.mcoe(
-                self,
-                verbose=verbose,
-                min_heat_rate=min_heat_rate,
-                min_fuel_cost_per_mwh=min_fuel_cost_per_mwh,
-                min_cap_fact=min_cap_fact,
-                max_cap_fact=max_cap_fact)
-        return self._dfs['mcoe']
+        return pudl.analysis.mcoe.mcoe(
+            self,
+            verbose=verbose,
+            min_heat_rate=min_heat_rate,
+            min_fuel_cost_per_mwh=min_fuel_cost_per_mwh,
+            min_cap_fact=min_cap_fact,
+            max_cap_fact=max_cap_fact)
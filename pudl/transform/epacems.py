@@ -1,11 +1,15 @@
 """Routines specific to cleaning up EPA CEMS hourly data."""
 
+import concurrent.futures
 import pandas as pd
 import numpy as np
 import sqlalchemy as sa
 import pudl
 import pudl.constants as pc
 
+# Plant UTC offsets from _load_plant_utc_offset, keyed by database URL.
+_PLANT_UTC_OFFSET_CACHE = {}
+
 ###############################################################################
 ###############################################################################
 # DATATABLE TRANSFORM FUNCTIONS
@@ -17,7 +21,8 @@ def fix_up_dates(df, plant_utc_offset):
     """Fix the dates for the CEMS data
     Args:
         df(pandas.DataFrame): A CEMS hourly dataframe for one year-month-state
-        plant_utc_offset(pandas.DataFrame): A dataframe of plants' timezones
+        plant_utc_offset(pandas.Series): The plants' UTC offsets, indexed by
+            plant_id_eia.
     Output:
         pandas.DataFrame: The same data, with an op_datetime_utc column added
         and the op_date and op_hour columns removed
@@ -25,30 +30,48 @@ def fix_up_dates(df, plant_utc_offset):
     # Convert op_date and op_hour from string and integer to datetime:
     # Note that doing this conversion, rather than reading the CSV with
     # `parse_dates=True`, is >10x faster.
-    df["op_datetime_naive"] = (
-        # Read the date as a datetime, so all the dates are midnight
-        # Mark as UTC (it's not true yet, but it will be once we add
-        # utc_offsets, and it's easier to do here)
-        pd.to_datetime(
-            df["op_date"], format=r"%m-%d-%Y", exact=True, cache=True, utc=True
-        )
-        +
-        # Add the hour
-        pd.to_timedelta(df["op_hour"], unit="h", box=False)
+    # There are only ~31 distinct dates in each chunk, so parse each of the
+    # categories once, look them up by code, and add the hours as int64
+    # nanoseconds. (This is a no-op if op_date is already categorical.)
+    op_date = df["op_date"].astype("category").cat
+    op_date_ns = (
+        pd.to_datetime(op_date.categories, format=r"%m-%d-%Y", exact=True)
+        .values.astype("datetime64[ns]").view("i8")
     )
-    df = df.merge(plant_utc_offset, how="left", on="plant_id_eia")
+    op_date_codes = op_date.codes.values
+    # A missing op_hour is read as NaN, which has no int64 equivalent, so fill
+    # it with 0 here and set it to NaT below.
+    op_hour_missing = df["op_hour"].isna().values
+    op_hour = df["op_hour"].fillna(0).to_numpy(dtype=np.int64)
+    op_datetime_naive = (
+        # A missing op_date has code -1. The 0 on the end keeps it from picking
+        # up the last category's date (or failing if there are no dates), and
+        # it's set to NaT below.
+        np.append(op_date_ns, 0)[op_date_codes]
+        + op_hour * np.int64(3600 * 10**9)
+    ).view("datetime64[ns]")
+    op_datetime_naive[(op_date_codes < 0) | op_hour_missing] = \
+        np.datetime64("NaT")
+    # Look up each plant's position in plant_utc_offset, and use it to index
+    # straight into the offsets, rather than merging on the plant IDs.
+    plant_pos = plant_utc_offset.index.get_indexer(df["plant_id_eia"])
     # Some of the timezones in the plants_entity_eia table may be missing,
-    # but none of the CEMS plants should be.
-    if not df["utc_offset"].notna().all():
-        missing_plants = df.loc[df["utc_offset"].isna(), "plant_id_eia"].unique()
+    # but none of the CEMS plants should be. They get a position of -1.
+    missing = plant_pos < 0
+    if missing.any():
+        missing_plants = df.loc[missing, "plant_id_eia"].unique()
         raise ValueError(
             "utc_offset should never be missing for CEMS plants, but was missing " +
-            "for these: " + str(list(missing_plants))
+            "for these: " + str(sorted(missing_plants.tolist()))
             )
+    utc_offset = plant_utc_offset.values[plant_pos]
+    # Drop the columns we're done with all at once, rather than rebuilding
+    # the dataframe once per deleted column.
+    df = df.drop(columns=["op_date", "op_hour"])
     # Add the offset from UTC. CEMS data don't have DST, so the offset is
-    # always the same for a given plant.
-    df["operating_datetime_utc"] = df["op_datetime_naive"] + df["utc_offset"]
-    del df["op_date"], df["op_hour"], df["op_datetime_naive"], df["utc_offset"]
+    # always the same for a given plant, and the result is in UTC.
+    df["operating_datetime_utc"] = pd.to_datetime(
+        op_datetime_naive + utc_offset, utc=True)
     return df
 
 
@@ -59,23 +82,52 @@ def _load_plant_utc_offset(pudl_engine):
 
     CEMS times don't change for DST, so we get get the UTC offset by using the
     offset for the plants' timezones in January.
+
+    The offsets are only looked up once per database URL in each process, so
+    repeated calls to transform() don't go back to the database. Call
+    clear_plant_utc_offset_cache() if plants_entity_eia has been reloaded.
     """
     import pytz
 
-    plants_eia_entity_select = sa.sql.select(
-        [pudl.models.entities.PUDLBase.metadata.tables["plants_entity_eia"]]
+    cache_key = str(pudl_engine.url)
+    if cache_key in _PLANT_UTC_OFFSET_CACHE:
+        return _PLANT_UTC_OFFSET_CACHE[cache_key].copy()
+
+    plants_entity_eia = \
+        pudl.models.entities.PUDLBase.metadata.tables["plants_entity_eia"]
+    # Some plants lack the info to get a timezone. None of these plants are in
+    # CEMS, so only select the plants (and columns) we actually need.
+    plants_eia_entity_select = (
+        sa.sql.select([plants_entity_eia.c.plant_id_eia,
+                       plants_entity_eia.c.timezone])
+        .where(plants_entity_eia.c.timezone.isnot(None))
     )
-    # TODO: that this reads all the columns. It would be better to select a subset.
-    timezones = pd.read_sql(plants_eia_entity_select, pudl_engine)[
-        ["plant_id_eia", "timezone"]
-    ].dropna()
-    # Some plants lack the info to get a timezone. None of these plants are in CEMS.
+    # Stream the results through a server-side cursor in chunks, to avoid
+    # holding several full copies of the query results in memory at once.
+    with pudl_engine.connect().execution_options(
+            stream_results=True) as conn:
+        timezones = pd.concat(
+            pd.read_sql(plants_eia_entity_select, conn, chunksize=10000),
+            ignore_index=True)
     jan1 = pd.datetime(2011, 1, 1)  # year doesn't matter
-    timezones["utc_offset"] = timezones["timezone"].apply(
-        lambda tz: pytz.timezone(tz).localize(jan1).utcoffset()
-    )
+    # There are only a few dozen distinct timezones, so look up each offset
+    # once and map them onto the plants, rather than localizing every row.
+    offset_map = {
+        tz: pytz.timezone(tz).localize(jan1).utcoffset()
+        for tz in timezones["timezone"].unique()
+    }
+    # Store the offsets as timedelta64[ns] so adding them to the datetimes
+    # in fix_up_dates is vectorized, rather than a per-row Python operation.
+    timezones["utc_offset"] = pd.to_timedelta(
+        timezones["timezone"].map(offset_map))
     del timezones["timezone"]
-    return timezones
+    _PLANT_UTC_OFFSET_CACHE[cache_key] = timezones
+    return timezones.copy()
+
+
+def clear_plant_utc_offset_cache():
+    """Forget the plant UTC offsets cached by _load_plant_utc_offset."""
+    _PLANT_UTC_OFFSET_CACHE.clear()
 
 
 def harmonize_eia_epa_orispl(df):
@@ -112,8 +164,11 @@ def add_facility_id_unit_id_epa(df):
     """
     if ("facility_id" not in df.columns) or ("unit_id_epa" not in df.columns):
         # Can't just assign np.NaN and get an integer NaN, so make a new array
-        # with the right shape:
-        na_col = pd.array(np.full(df.shape[0], np.NaN), dtype="Int64")
+        # with the right shape. Build it straight from an int64 buffer and an
+        # all-missing mask, rather than converting an array of float NaNs.
+        na_col = pd.arrays.IntegerArray(
+            np.zeros(df.shape[0], dtype=np.int64),
+            np.ones(df.shape[0], dtype=bool))
         if "facility_id" not in df.columns:
             df["facility_id"] = na_col
         if "unit_id_epa" not in df.columns:
@@ -152,29 +207,98 @@ def correct_gross_load_mw(df):
     # wrong (by writing KWh) if they report more.
     # (There is a cogen unit, 54634 unit 1, that regularly reports around
     # 1700 MW. I'm assuming they're correct.)
-    # This is rare, so don't bother most of the time.
-    bad = df["gross_load_mw"] > 2000
-    if bad.any():
-        df.loc[bad, "gross_load_mw"] = df.loc[bad, "gross_load_mw"] / 1000
+    # Correct a single writable copy of the column in place, only dividing
+    # the (rare) bad values, rather than going through the .loc indexer.
+    gross_load_mw = df["gross_load_mw"].to_numpy(dtype=float, copy=True)
+    np.divide(gross_load_mw, 1000.0, out=gross_load_mw,
+              where=gross_load_mw > 2000)
+    df["gross_load_mw"] = gross_load_mw
     return df
 
 
-def transform(pudl_engine, epacems_raw_dfs, verbose=True):
-    """Transform EPA CEMS hourly"""
+def _transform_one(yr_st, raw_df, plant_utc_offset):
+    """Run a single year-state CEMS dataframe through the transform pipeline
+
+    This is a module level function so that it can be pickled and handed off
+    to a worker process.
+
+    Args:
+        yr_st (tuple): The (year, state) identifying this chunk of data
+        raw_df (pd.DataFrame): The raw CEMS dataframe for that year and state
+        plant_utc_offset (pd.Series): The plants' UTC offsets, indexed by
+            plant_id_eia
+    Returns:
+        tuple: (yr_st, transformed dataframe)
+    """
+    # These columns have only a handful of distinct values in each chunk, so
+    # storing them as categoricals saves a lot of memory and makes lookups
+    # on them much cheaper.
+    raw_df = raw_df.astype({col: "category"
+                            for col in ("op_date", "state", "unitid")
+                            if col in raw_df.columns})
+    # Only a couple of columns need filling, so fill them one at a time
+    # rather than having fillna() walk the whole dataframe.
+    for col, fill_value in pc.epacems_columns_fill_na_dict.items():
+        if col in raw_df.columns:
+            raw_df[col] = raw_df[col].fillna(fill_value)
+    df = (
+        raw_df.pipe(harmonize_eia_epa_orispl)
+        .pipe(fix_up_dates, plant_utc_offset=plant_utc_offset)
+        .pipe(add_facility_id_unit_id_epa)
+        .pipe(correct_gross_load_mw)
+    )
+    return yr_st, df
+
+
+def transform(pudl_engine, epacems_raw_dfs, verbose=True,
+              max_workers=2, max_in_flight=None):
+    """Transform EPA CEMS hourly
+
+    Each year-state chunk is independent, so they're transformed in parallel
+    in a pool of worker processes. The transformed chunks are yielded in the
+    order they finish, which need not be the order they were extracted in.
+
+    Args:
+        pudl_engine (sqlalchemy.engine.Engine): A connection to the PUDL DB,
+            used to look up the plants' timezones.
+        epacems_raw_dfs (generator): Yields one-item dictionaries of raw
+            CEMS dataframes, keyed by (year, state).
+        verbose (bool): Whether to print progress messages.
+        max_workers (int): How many worker processes to use. Extraction is
+            serial, so a couple of workers are usually enough to keep up.
+        max_in_flight (int): The most raw year-state dataframes to hold in
+            memory at once, waiting on or being transformed by the workers.
+            Each one is a full year of data for a state, and is pickled out
+            to a worker and back, so keep this small. Defaults to
+            max_workers.
+    Yields:
+        tuple: ((year, state), transformed CEMS dataframe) pairs.
+    """
     if verbose:
         print("Transforming tables from EPA CEMS:")
+    if max_in_flight is None:
+        max_in_flight = max_workers
     # epacems_raw_dfs is a generator. Pull out one dataframe, run it through
     # a transformation pipeline, and yield it back as another generator.
-    plant_utc_offset = _load_plant_utc_offset(pudl_engine)
-    for raw_df_dict in epacems_raw_dfs:
-        # There's currently only one dataframe in this dict at a time, but
-        # that could be changed if you want.
-        for yr_st, raw_df in raw_df_dict.items():
-            df = (
-                raw_df.fillna(pc.epacems_columns_fill_na_dict)
-                .pipe(harmonize_eia_epa_orispl)
-                .pipe(fix_up_dates, plant_utc_offset=plant_utc_offset)
-                .pipe(add_facility_id_unit_id_epa)
-                .pipe(correct_gross_load_mw)
-            )
-            yield {yr_st: df}
+    plant_utc_offset = (
+        _load_plant_utc_offset(pudl_engine)
+        .set_index("plant_id_eia")["utc_offset"]
+    )
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers) as executor:
+        pending = set()
+        for raw_df_dict in epacems_raw_dfs:
+            # There's currently only one dataframe in this dict at a time, but
+            # that could be changed if you want.
+            for yr_st, raw_df in raw_df_dict.items():
+                pending.add(executor.submit(
+                    _transform_one, yr_st, raw_df, plant_utc_offset))
+            # Don't read too far ahead of the workers, or the raw dataframes
+            # waiting to be transformed will pile up in memory.
+            if len(pending) >= max_in_flight:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in concurrent.futures.as_completed(pending):
+            yield future.result()
@@ -121,6 +121,22 @@ def parse_command_line(argv):
         is everything: all 48 continental US states plus Washington DC.""",
         default=pc.cems_states.keys()
     )
+    parser.add_argument(
+        '--start-date',
+        dest='start_date',
+        type=str,
+        help="""Skip the monthly EPA CEMS files which end before this date,
+        given as YYYY-MM-DD. Default is no lower bound.""",
+        default=None
+    )
+    parser.add_argument(
+        '--end-date',
+        dest='end_date',
+        type=str,
+        help="""Skip the monthly EPA CEMS files which start after this date,
+        given as YYYY-MM-DD. Default is no upper bound.""",
+        default=None
+    )
     parser.add_argument(
         '-p',
         '--partition_cols',
@@ -149,6 +165,23 @@ def parse_command_line(argv):
         pudl_test database instead.""",
         default=False
     )
+    parser.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        help="""How many processes to use for transforming the EPA CEMS data.
+        (default: %(default)s)""",
+        default=2
+    )
+    parser.add_argument(
+        '--max-in-flight',
+        dest='max_in_flight',
+        type=int,
+        help="""The most raw year-state dataframes to hold in memory at once
+        while they are being transformed. Defaults to the number of
+        workers.""",
+        default=None
+    )
     arguments = parser.parse_args(argv[1:])
     return arguments
 
@@ -167,7 +200,7 @@ def year_from_operating_datetime(df):
     return df
 
 
-def cems_to_parquet(transformed_df_dicts, outdir=None, schema=None,
+def cems_to_parquet(transformed_dfs, outdir=None, schema=None,
                     compression='snappy', partition_cols=('year', 'state')):
     """
     Take transformed EPA CEMS dataframes and output them as Parquet files.
@@ -184,26 +217,25 @@ def cems_to_parquet(transformed_df_dicts, outdir=None, schema=None,
     if not outdir:
         raise AssertionError("Required output directory not specified.")
 
-    for df_dict in transformed_df_dicts:
-        for yr_st, df in df_dict.items():
-            print(f'            {yr_st}: {len(df)} records')
-            if not df.empty:
-                df = (
-                    df.astype(IN_DTYPES)
-                    .pipe(downcast_numeric,
-                          from_dtype='float',
-                          to_dtype='float')
-                    .pipe(downcast_numeric,
-                          from_dtype='int',
-                          to_dtype='unsigned')
-                    .pipe(year_from_operating_datetime)
-                    .astype(OUT_DTYPES)
-                )
-                pq.write_to_dataset(
-                    pa.Table.from_pandas(
-                        df, preserve_index=False, schema=schema),
-                    root_path=outdir, partition_cols=partition_cols,
-                    compression=compression)
+    for yr_st, df in transformed_dfs:
+        print(f'            {yr_st}: {len(df)} records')
+        if not df.empty:
+            df = (
+                df.astype(IN_DTYPES)
+                .pipe(downcast_numeric,
+                      from_dtype='float',
+                      to_dtype='float')
+                .pipe(downcast_numeric,
+                      from_dtype='int',
+                      to_dtype='unsigned')
+                .pipe(year_from_operating_datetime)
+                .astype(OUT_DTYPES)
+            )
+            pq.write_to_dataset(
+                pa.Table.from_pandas(
+                    df, preserve_index=False, schema=schema),
+                root_path=outdir, partition_cols=partition_cols,
+                compression=compression)
 
 
 def main():
@@ -225,10 +257,13 @@ def main():
     raw_dfs = pudl.extract.epacems.extract(
         epacems_years=args.years,
         states=args.states,
-        verbose=args.verbose
+        verbose=args.verbose,
+        start_date=args.start_date,
+        end_date=args.end_date
     )
     transformed_dfs = pudl.transform.epacems.transform(
-        pudl_engine=pudl_engine, epacems_raw_dfs=raw_dfs, verbose=args.verbose
+        pudl_engine=pudl_engine, epacems_raw_dfs=raw_dfs, verbose=args.verbose,
+        max_workers=args.workers, max_in_flight=args.max_in_flight
     )
 
     # Do a few additional manipulations specific to the Apache Parquet output,
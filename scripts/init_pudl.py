@@ -63,6 +63,13 @@ def main():
                       eia860_years=settings_init['eia860_years'],
                       epacems_years=settings_init['epacems_years'],
                       epacems_states=settings_init['epacems_states'],
+                      epacems_max_workers=settings_init.get(
+                          'epacems_max_workers', 2),
+                      epacems_max_in_flight=settings_init.get(
+                          'epacems_max_in_flight'),
+                      epacems_start_date=settings_init.get(
+                          'epacems_start_date'),
+                      epacems_end_date=settings_init.get('epacems_end_date'),
                       verbose=settings_init['verbose'],
                       debug=settings_init['debug'],
                       pudl_testing=settings_init['pudl_testing'],
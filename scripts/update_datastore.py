@@ -92,6 +92,31 @@ def parse_command_line(argv):
         CEMS dataset.""",
         default=pc.cems_states.keys()
     )
+    parser.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        help="""Maximum number of files to download at the same time.
+        (default: %(default)s).""",
+        default=8
+    )
+    parser.add_argument(
+        '--unzip-workers',
+        dest='unzip_workers',
+        type=int,
+        help="""Maximum number of downloaded files to unzip and organize at
+        the same time. (default: %(default)s).""",
+        default=2
+    )
+    parser.add_argument(
+        '--workers-per-source',
+        dest='workers_per_source',
+        type=int,
+        help="""Maximum number of simultaneous downloads from any one data
+        source, to avoid overloading the reporting agency's servers.
+        (default: %(default)s).""",
+        default=4
+    )
 
     arguments = parser.parse_args(argv[1:])
     return arguments
@@ -100,6 +125,8 @@ def parse_command_line(argv):
 def main():
     """Main function controlling flow of the script."""
     import concurrent.futures
+    import contextlib
+    import threading
 
     args = parse_command_line(sys.argv)
 
@@ -120,16 +147,68 @@ def main():
             if args.verbose and bad_yrs:
                 print("Invalid {} years ignored: {}.".format(src, bad_yrs))
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        for src in args.sources:
-            for yr in yrs_by_src[src]:
-                executor.submit(pudl.datastore.update, src, yr, args.states,
-                                clobber=args.clobber,
+    # Bound the number of simultaneous downloads, both overall and for each
+    # data source, so we don't hammer any one reporting agency's servers or
+    # pile up too many large files in flight at once. Each data source gets
+    # its own pool, sized to its limit, and the overall limit is shared
+    # between them. That way a thread waiting on the overall limit only
+    # holds up its own data source, and the others keep downloading.
+    download_slots = threading.BoundedSemaphore(args.workers)
+
+    def _fetch(src, yr):
+        """Download the data for src and yr if needed, saying whether it was."""
+        need_update = pudl.datastore.check_if_need_update(
+            source=src, year=yr, states=args.states, datadir=args.datadir,
+            clobber=args.clobber, verbose=args.verbose)
+        if need_update and not args.no_download:
+            with download_slots:
+                pudl.datastore.download(src, yr, args.states,
+                                        datadir=args.datadir,
+                                        verbose=args.verbose)
+        return need_update
+
+    def _organize(src, yr):
+        """Move the downloaded src and yr data into place, and unzip it."""
+        pudl.datastore.organize(src, yr, args.states,
                                 unzip=args.unzip,
-                                verbose=args.verbose,
                                 datadir=args.datadir,
+                                verbose=args.verbose,
                                 no_download=args.no_download)
 
+    # Downloading is network bound, and unzipping is mostly disk and CPU
+    # bound, so do them in separate pools. Each file is handed off to be
+    # organized as soon as it's downloaded, while other downloads continue.
+    failed = []
+    with contextlib.ExitStack() as stack:
+        downloaders = {
+            src: stack.enter_context(concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(args.workers_per_source, args.workers)))
+            for src in args.sources}
+        unzipper = stack.enter_context(concurrent.futures.ThreadPoolExecutor(
+            max_workers=args.unzip_workers))
+        pending = {downloaders[src].submit(_fetch, src, yr):
+                   ('download', src, yr)
+                   for src in args.sources
+                   for yr in yrs_by_src[src]}
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                stage, src, yr = pending.pop(future)
+                # Report failures as soon as they happen, not at the end.
+                try:
+                    need_organize = future.result()
+                except Exception as e:
+                    failed.append((src, yr))
+                    print(f"Failed to {stage} {src} {yr}: {e}")
+                    continue
+                if stage == 'download' and need_organize:
+                    pending[unzipper.submit(_organize, src, yr)] = \
+                        ('organize', src, yr)
+    if failed:
+        print(f"Failed to update: {failed}")
+        return 1
+
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -0,0 +1,61 @@
+"""Tests for reading the EPA CEMS CSVs, using the Idaho 2017 test data."""
+
+import glob
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+import pytest
+import pudl
+import pudl.constants as pc
+import pudl.extract.epacems
+
+# These only read small local files, so they're cheap enough to run on Travis.
+pytestmark = pytest.mark.travis_ci
+
+CEMS_TEST_FILES = sorted(glob.glob(os.path.join(
+    os.path.dirname(__file__), 'data', 'epa', 'cems', 'epacems2017',
+    'epacems2017id*.zip')))
+
+
+def _pandas_read_cems_csv(filename):
+    """Read a CEMS CSV the way read_cems_csv did before using Arrow."""
+    return pd.read_csv(
+        filename,
+        index_col=False,
+        usecols=lambda col: col not in pc.epacems_columns_to_ignore,
+        dtype=pc.epacems_csv_dtypes,
+    ).rename(columns=pc.epacems_rename_dict)
+
+
+@pytest.mark.parametrize("filename", CEMS_TEST_FILES,
+                         ids=os.path.basename)
+def test_read_cems_csv_matches_pandas(filename):
+    """The Arrow CSV reader gives the same dataframe as pd.read_csv."""
+    pd.testing.assert_frame_equal(
+        pudl.extract.epacems.read_cems_csv(filename),
+        _pandas_read_cems_csv(filename))
+
+
+def test_cems_test_files_present():
+    """There's a full year of Idaho test data to check the reader against."""
+    assert len(CEMS_TEST_FILES) == 12
+
+
+def test_read_cems_csv_nulls(tmp_path):
+    """Empty fields are read as missing values, including in int columns."""
+    filename = str(tmp_path / "epacems2017xx01.zip")
+    with zipfile.ZipFile(filename, "w") as archive:
+        archive.writestr("epacems2017xx01.csv", "\n".join([
+            '"STATE","ORISPL_CODE","UNITID","OP_DATE","OP_HOUR",'
+            '"GLOAD (MW)","SO2_MASS_MEASURE_FLG"',
+            '"ID","7456","1","01-01-2017","0","12.5","Measured"',
+            '"ID","7456","1","01-01-2017","","",""',
+        ]))
+    df = pudl.extract.epacems.read_cems_csv(filename)
+    assert df["op_hour"].isna().tolist() == [False, True]
+    assert df["op_hour"].dtype == np.float64
+    assert df["gross_load_mw"].isna().tolist() == [False, True]
+    assert df["so2_mass_measurement_code"].isna().tolist() == [False, True]
+    assert df["plant_id_eia"].tolist() == [7456, 7456]
+    assert df["unitid"].tolist() == ["1", "1"]
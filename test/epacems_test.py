@@ -0,0 +1,207 @@
+"""Tests for the EPA CEMS transform functions, on synthetic data."""
+
+import io
+import numpy as np
+import pandas as pd
+import pytest
+import pudl
+import pudl.extract.epacems
+import pudl.load
+import pudl.transform.epacems
+
+# These only use synthetic data, so they're cheap enough to run on Travis.
+pytestmark = pytest.mark.travis_ci
+
+
+@pytest.fixture
+def plant_utc_offset():
+    """UTC offsets for a couple of plants, as transform() builds them."""
+    return pd.Series(pd.to_timedelta(["-5h", "-7h"]),
+                     index=pd.Index([3, 7], name="plant_id_eia"),
+                     name="utc_offset")
+
+
+def _raw_cems_df(state="CO", unitid=("1", "2", "1", "2")):
+    """Make a small dataframe that looks like one raw CEMS year-state."""
+    return pd.DataFrame({
+        "state": [state] * 4,
+        "plant_id_eia": [3, 7, 3, 7],
+        "unitid": list(unitid),
+        "op_date": ["01-02-2017", "01-02-2017", "06-30-2017", "12-31-2017"],
+        "op_hour": [0, 5, 13, 23],
+        "operating_time_hours": [1.0, 1.0, 0.5, 0.0],
+        "gross_load_mw": [100.0, np.nan, 2500.0, 10.0],
+        "so2_mass_measurement_code": ["Measured", None, "Measured", None],
+        "heat_content_mmbtu": [np.nan, 1.0, 2.0, 3.0],
+    })
+
+
+def test_bulk_copy_csv_with_categoricals(monkeypatch, plant_utc_offset):
+    """Categorical CEMS columns are loaded into postgres as plain values."""
+    copied = []
+
+    def fake_copy_from(f, tbl, engine, columns, **kwargs):
+        copied.append(f.read())
+    monkeypatch.setattr(pudl.load.postgres_copy, "copy_from", fake_copy_from)
+
+    # Chunks with different categories, like two different states.
+    transformed = [
+        pudl.transform.epacems._transform_one(
+            yr_st, raw_df, plant_utc_offset)[1]
+        for yr_st, raw_df in [
+            ((2017, "CO"), _raw_cems_df()),
+            ((2017, "WY"), _raw_cems_df(state="WY", unitid="ABCD")),
+        ]
+    ]
+    assert transformed[0]["state"].dtype.name == "category"
+    with pudl.load.BulkCopy("hourly_emissions_epacems", engine=None) as loader:
+        for df in transformed:
+            loader.add(df)
+    # Load the same data again without any categorical columns
+    with pudl.load.BulkCopy("hourly_emissions_epacems", engine=None) as loader:
+        for df in transformed:
+            categoricals = df.select_dtypes(include="category").columns
+            loader.add(df.astype({col: object for col in categoricals}))
+
+    assert len(copied) == 2
+    assert copied[0] == copied[1]
+    loaded = pd.read_csv(io.StringIO(copied[0]))
+    assert list(loaded["state"]) == ["CO"] * 4 + ["WY"] * 4
+    assert list(loaded["unitid"]) == ["1", "2", "1", "2", "A", "B", "C", "D"]
+
+
+def test_fix_up_dates_missing_op_date(plant_utc_offset):
+    """A missing op_date gives a NaT, not some other row's date."""
+    raw_df = _raw_cems_df()
+    raw_df.loc[2, "op_date"] = np.nan
+    for df in [raw_df, raw_df.astype({"op_date": "category"})]:
+        out = pudl.transform.epacems.fix_up_dates(df.copy(), plant_utc_offset)
+        assert out["operating_datetime_utc"].isna().tolist() == \
+            [False, False, True, False]
+
+
+def test_fix_up_dates_missing_op_hour(plant_utc_offset):
+    """A missing op_hour, which Arrow reads as NaN, gives a NaT."""
+    raw_df = _raw_cems_df().astype({"op_hour": float})
+    raw_df.loc[1, "op_hour"] = np.nan
+    out = pudl.transform.epacems.fix_up_dates(raw_df, plant_utc_offset)
+    assert out["operating_datetime_utc"].isna().tolist() == \
+        [False, True, False, False]
+    assert out["operating_datetime_utc"].iloc[3] == \
+        pd.Timestamp("2017-12-31 16:00", tz="UTC")
+
+
+def test_correct_gross_load_mw():
+    """Only gross loads that are impossibly large get divided by 1000."""
+    df = pd.DataFrame({"gross_load_mw": [0.0, np.nan, 1999.0, 2500.0]})
+    out = pudl.transform.epacems.correct_gross_load_mw(df)
+    np.testing.assert_array_equal(out["gross_load_mw"],
+                                  [0.0, np.nan, 1999.0, 2.5])
+
+
+def test_fix_up_dates_keeps_plant_ids(plant_utc_offset):
+    """The plant IDs come out of fix_up_dates unchanged."""
+    raw_df = _raw_cems_df()
+    out = pudl.transform.epacems.fix_up_dates(raw_df.copy(), plant_utc_offset)
+    assert out["plant_id_eia"].tolist() == [3, 7, 3, 7]
+    assert out["plant_id_eia"].dtype == raw_df["plant_id_eia"].dtype
+
+
+@pytest.mark.parametrize("start_date, end_date, expected", [
+    # The range may start or end on any day of the month, inclusive
+    ("2017-03-31", None, True),
+    ("2017-04-01", None, False),
+    (None, "2017-03-01", True),
+    (None, "2017-02-28", False),
+    ("2017-03-15", "2017-03-15", True),
+    # An unbounded range includes every month
+    (None, None, True),
+    # Timestamps and strings are treated the same
+    (pd.Timestamp("2017-03-31 23:00"), None, True),
+    (pd.Timestamp("2017-04-01"), None, False),
+    (None, pd.Timestamp("2017-02-28 23:00"), False),
+])
+def test_month_in_date_range(start_date, end_date, expected):
+    """Only the months overlapping the (inclusive) date range are kept."""
+    assert pudl.extract.epacems._month_in_date_range(
+        2017, 3, start_date=start_date, end_date=end_date) == expected
+
+
+def test_fix_up_dates_matches_datetime_parsing(plant_utc_offset):
+    """The fast datetime arithmetic agrees with plain pandas parsing."""
+    raw_df = _raw_cems_df()
+    # The same calculation done row by row with pandas datetime functions
+    expected = (
+        pd.to_datetime(raw_df["op_date"], format=r"%m-%d-%Y", utc=True)
+        + pd.to_timedelta(raw_df["op_hour"], unit="h")
+        + raw_df["plant_id_eia"].map(plant_utc_offset)
+    ).astype("datetime64[ns, UTC]")
+    out = pudl.transform.epacems.fix_up_dates(raw_df.copy(), plant_utc_offset)
+    pd.testing.assert_series_equal(
+        out["operating_datetime_utc"], expected, check_names=False)
+    assert "op_date" not in out.columns and "op_hour" not in out.columns
+
+    # And the same again when op_date is categorical, as in _transform_one
+    _, transformed = pudl.transform.epacems._transform_one(
+        (2017, "CO"), raw_df.copy(), plant_utc_offset)
+    pd.testing.assert_series_equal(
+        transformed["operating_datetime_utc"], expected, check_names=False)
+    assert transformed["operating_datetime_utc"].iloc[0] == \
+        pd.Timestamp("2017-01-01 19:00", tz="UTC")
+
+
+def test_fix_up_dates_missing_plant(plant_utc_offset):
+    """Plants without a UTC offset raise an error naming them."""
+    raw_df = _raw_cems_df()
+    raw_df.loc[[1, 3], "plant_id_eia"] = 5
+    with pytest.raises(ValueError, match=r"\[5\]"):
+        pudl.transform.epacems.fix_up_dates(raw_df, plant_utc_offset)
+    with pytest.raises(ValueError, match=r"\[5\]"):
+        pudl.transform.epacems._transform_one(
+            (2017, "CO"), raw_df, plant_utc_offset)
+
+
+@pytest.fixture
+def patched_utc_offset(monkeypatch, plant_utc_offset):
+    """Make transform() use the synthetic UTC offsets, not the database."""
+    monkeypatch.setattr(pudl.transform.epacems, "_load_plant_utc_offset",
+                        lambda pudl_engine: plant_utc_offset.reset_index())
+
+
+def _raw_cems_dfs(states, pulled):
+    """Yield raw CEMS dataframes like extract() does, counting them."""
+    for state in states:
+        pulled.append(state)
+        yield {(2017, state): _raw_cems_df(state=state)}
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 2, 5])
+def test_transform_yields_every_chunk(patched_utc_offset, max_in_flight):
+    """Every year-state comes back, without reading too far ahead."""
+    states = ["CO", "ID", "WY", "UT"]
+    pulled = []
+    transformed = {}
+    for yr_st, df in pudl.transform.epacems.transform(
+            pudl_engine=None, epacems_raw_dfs=_raw_cems_dfs(states, pulled),
+            verbose=False, max_workers=2, max_in_flight=max_in_flight):
+        # The chunks still waiting on the workers are the only ones pulled
+        # from the generator but not yet yielded.
+        assert len(pulled) - len(transformed) <= max_in_flight
+        transformed[yr_st] = df
+    assert set(transformed) == {(2017, state) for state in states}
+    for (_, state), df in transformed.items():
+        assert df["state"].tolist() == [state] * 4
+        assert df["operating_datetime_utc"].notna().all()
+
+
+def test_transform_raises_worker_errors(patched_utc_offset):
+    """An error transforming a chunk in a worker is raised by transform()."""
+    def raw_dfs():
+        yield {(2017, "CO"): _raw_cems_df()}
+        bad_df = _raw_cems_df(state="WY")
+        bad_df["plant_id_eia"] = 5
+        yield {(2017, "WY"): bad_df}
+    with pytest.raises(ValueError, match=r"\[5\]"):
+        list(pudl.transform.epacems.transform(
+            pudl_engine=None, epacems_raw_dfs=raw_dfs(), verbose=False,
+            max_workers=2, max_in_flight=1))
@@ -0,0 +1,114 @@
+"""Tests for the PudlTabl dataframe cache, with the database calls patched."""
+
+import collections
+import inspect
+import numpy as np
+import pandas as pd
+import pytest
+import pudl
+import pudl.analysis.mcoe
+import pudl.output.eia860
+import pudl.output.pudltabl
+
+# These don't touch the database, so they're cheap enough to run on Travis.
+pytestmark = pytest.mark.travis_ci
+
+
+@pytest.fixture
+def mcoe_calls(monkeypatch):
+    """Record the arguments each MCOE calculation is run with."""
+    calls = []
+
+    def fake_mcoe(pudl_out, **kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame({"mcoe": [len(calls)]})
+    monkeypatch.setattr(pudl.analysis.mcoe, "mcoe", fake_mcoe)
+    return calls
+
+
+def test_cached_df_positional_args(mcoe_calls):
+    """update comes first, and the method's own arguments still line up."""
+    pudl_out = pudl.output.pudltabl.PudlTabl(freq="MS")
+    first = pudl_out.mcoe(False, 6.0)
+    assert mcoe_calls[-1]["min_heat_rate"] == 6.0
+    # A cached dataframe is returned without recalculating it.
+    assert pudl_out.mcoe() is first
+    assert len(mcoe_calls) == 1
+    pudl_out.mcoe(True, 7.0, 1.0)
+    assert mcoe_calls[-1]["min_heat_rate"] == 7.0
+    assert mcoe_calls[-1]["min_fuel_cost_per_mwh"] == 1.0
+    pudl_out.mcoe(update=True, verbose=True)
+    assert mcoe_calls[-1]["min_heat_rate"] == 5.5
+    assert mcoe_calls[-1]["verbose"]
+    assert len(mcoe_calls) == 3
+
+
+def test_cached_df_signature():
+    """The update argument shows up in the accessors' signatures."""
+    params = list(inspect.signature(
+        pudl.output.pudltabl.PudlTabl.mcoe).parameters)
+    assert params[:3] == ["self", "update", "min_heat_rate"]
+    params = list(inspect.signature(
+        pudl.output.pudltabl.PudlTabl.pu_eia860).parameters)
+    assert params == ["self", "update"]
+
+
+@pytest.fixture
+def eia860_calls(monkeypatch):
+    """Patch some EIA 860 outputs to make ~0.8 MB frames, counting calls."""
+    calls = collections.Counter()
+
+    def fake_output(name, n_rows):
+        def output(**kwargs):
+            calls[name] += 1
+            return pd.DataFrame({name: np.zeros(n_rows)})
+        return output
+    for name in ["plants_eia860", "generators_eia860", "ownership_eia860"]:
+        monkeypatch.setattr(pudl.output.eia860, name,
+                            fake_output(name, 100_000))
+    # One frame that's over a 1 MB budget by itself.
+    monkeypatch.setattr(pudl.output.eia860, "utilities_eia860",
+                        fake_output("utilities_eia860", 200_000))
+    return calls
+
+
+def test_cache_evicts_least_recently_used(eia860_calls):
+    """Going over max_cache_mb drops the least recently used dataframes."""
+    pudl_out = pudl.output.pudltabl.PudlTabl(max_cache_mb=2)
+    pudl_out.plants_eia860()
+    pudl_out.gens_eia860()
+    # Using the plants again makes the generators the least recently used.
+    pudl_out.plants_eia860()
+    assert eia860_calls["plants_eia860"] == 1
+    pudl_out.own_eia860()
+    assert list(pudl_out._dfs) == ["plants_eia860", "own_eia860"]
+    assert set(pudl_out._df_sizes) == set(pudl_out._dfs)
+    # The evicted dataframe is regenerated when it's requested again.
+    pudl_out.gens_eia860()
+    assert eia860_calls["generators_eia860"] == 2
+    assert list(pudl_out._dfs) == ["own_eia860", "gens_eia860"]
+
+
+def test_cache_keeps_newest_dataframe(eia860_calls):
+    """The dataframe just added is kept, even if it's over budget alone."""
+    pudl_out = pudl.output.pudltabl.PudlTabl(max_cache_mb=1)
+    pudl_out.plants_eia860()
+    big = pudl_out.utils_eia860()
+    assert list(pudl_out._dfs) == ["utils_eia860"]
+    assert pudl_out.utils_eia860() is big
+    assert eia860_calls["utilities_eia860"] == 1
+
+
+def test_cache_unbounded_by_default(eia860_calls):
+    """Without max_cache_mb, nothing is evicted."""
+    pudl_out = pudl.output.pudltabl.PudlTabl()
+    for _ in range(2):
+        pudl_out.plants_eia860()
+        pudl_out.gens_eia860()
+        pudl_out.own_eia860()
+        pudl_out.utils_eia860()
+    assert len(pudl_out._dfs) == 4
+    assert set(eia860_calls.values()) == {1}
+    pudl_out.invalidate("plants_eia860")
+    pudl_out.plants_eia860()
+    assert eia860_calls["plants_eia860"] == 2